@@ -3,6 +3,7 @@ Futures Backtesting Engine
 Wrapper for futures strategy backtesting compatible with Streamlit UI.
 """
 import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import timedelta
@@ -12,6 +13,50 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from futures.strategy import check_for_trade
 from data.futures_fetcher import load_futures_data, get_daily_levels
+from utils.jit import njit
+
+
+# Time-based exit after holding for 24 hours
+MAX_HOLD_NS = int(timedelta(hours=24).total_seconds() * 1e9)
+
+# Exit codes returned by _find_exit
+EXIT_STOP, EXIT_TARGET, EXIT_TIME = 0, 1, 2
+EXIT_REASONS = ("Stop Loss", "Target Hit", "Time Exit")
+
+
+@njit(cache=True)
+def _find_exit(highs, lows, closes, bar_ns, start, is_long, stop, target, time_exit_ns):
+    """
+    Find the bar where an open trade exits.
+    
+    Stops are checked before targets on each bar, then the time exit.
+    
+    Args:
+        highs, lows, closes: Bar price arrays
+        bar_ns: Bar timestamps as int64 nanoseconds
+        start: First bar index to check (bar after entry)
+        is_long: True for LONG trades, False for SHORT
+        stop: Stop price
+        target: Target price
+        time_exit_ns: Timestamp (ns) at or after which the trade exits at close
+        
+    Returns:
+        tuple: (exit index or -1 if still open, exit price, exit code)
+    """
+    for j in range(start, len(closes)):
+        if is_long:
+            if lows[j] <= stop:
+                return j, stop, EXIT_STOP
+            if highs[j] >= target:
+                return j, target, EXIT_TARGET
+        else:
+            if highs[j] >= stop:
+                return j, stop, EXIT_STOP
+            if lows[j] <= target:
+                return j, target, EXIT_TARGET
+        if bar_ns[j] >= time_exit_ns:
+            return j, closes[j], EXIT_TIME
+    return -1, 0.0, -1
 
 
 def run_futures_backtest(
@@ -33,7 +78,7 @@ def run_futures_backtest(
         min_stop_points: Minimum stop distance in points
         risk_percent_bullish: Risk per trade when biased (%)
         risk_percent_neutral: Risk per trade when neutral (%)
-        custom_data: Optional DataFrame with custom data (for Excel uploads)
+        custom_data: Optional pre-loaded DataFrame (Excel upload or cached default data)
         
     Returns:
         dict: Backtest results with trade history, portfolio history, and data
@@ -54,119 +99,133 @@ def run_futures_backtest(
     
     daily = get_daily_levels(df)
     
+    # Bar arrays for the JIT exit scan
+    timestamps = df.index
+    bar_dates = timestamps.date
+    bar_ns = timestamps.values.astype('datetime64[ns]').astype(np.int64)
+    highs = df['high'].to_numpy(dtype=np.float64)
+    lows = df['low'].to_numpy(dtype=np.float64)
+    closes = df['close'].to_numpy(dtype=np.float64)
+    n_bars = len(df)
+    
+    # Lightweight bar records for the entry check (attribute access only)
+    bars = list(df.itertuples())
+    
     # Initialize tracking
     equity = initial_capital
     trades_log = []
-    portfolio_history = []
-    open_trade = None
+    portfolio_values = np.empty(n_bars)
+    cash_values = np.empty(n_bars)
     state = None
     current_date = None
     
+    def new_day_state(day):
+        return {
+            "equity": equity,
+            "losses": 0,
+            "bias": "NEUTRAL",
+            "pdh": daily.loc[day, "PDH"],
+            "pdl": daily.loc[day, "PDL"],
+            "h1_highs": [],
+            "h1_lows": [],
+            "h4_highs": [],
+            "h4_lows": [],
+            "h1_fvgs": [],
+        }
+    
     # Run backtest
-    for ts, row in df.iterrows():
-        day = ts.date()
+    i = 0
+    while i < n_bars:
+        ts = timestamps[i]
+        day = bar_dates[i]
         
         # Reset daily state at start of new day
         if day != current_date:
             current_date = day
             if day in daily.index:
-                state = {
-                    "equity": equity,
-                    "losses": 0,
-                    "bias": "NEUTRAL",
-                    "pdh": daily.loc[day, "PDH"],
-                    "pdl": daily.loc[day, "PDL"],
-                    "h1_highs": [],
-                    "h1_lows": [],
-                    "h4_highs": [],
-                    "h4_lows": [],
-                    "h1_fvgs": [],
-                }
+                state = new_day_state(day)
         
-        # Track portfolio value
-        portfolio_value = equity
-        if open_trade:
-            # Calculate unrealized P&L
-            if open_trade["direction"] == "LONG":
-                unrealized_pnl = open_trade["qty"] * (row.close - open_trade["entry"])
-            else:
-                unrealized_pnl = open_trade["qty"] * (open_trade["entry"] - row.close)
-            portfolio_value = equity + unrealized_pnl
-        
-        portfolio_history.append({
-            "Date": ts,
-            "Portfolio_Value": portfolio_value,
-            "Cash": equity,
-            "Positions_Value": portfolio_value - equity
-        })
-        
-        # Check for exit if in a trade
-        if open_trade:
-            elapsed = ts - open_trade["entry_time"]
-            exit_price = None
-            exit_reason = None
-            
-            if open_trade["direction"] == "LONG":
-                if row.low <= open_trade["stop"]:
-                    exit_price = open_trade["stop"]
-                    exit_reason = "Stop Loss"
-                elif row.high >= open_trade["target"]:
-                    exit_price = open_trade["target"]
-                    exit_reason = "Target Hit"
-            else:  # SHORT
-                if row.high >= open_trade["stop"]:
-                    exit_price = open_trade["stop"]
-                    exit_reason = "Stop Loss"
-                elif row.low <= open_trade["target"]:
-                    exit_price = open_trade["target"]
-                    exit_reason = "Target Hit"
-            
-            # Time-based exit (24 hours)
-            if exit_price is None and elapsed >= timedelta(hours=24):
-                exit_price = row.close
-                exit_reason = "Time Exit"
-            
-            # Exit trade
-            if exit_price is not None:
-                pnl = open_trade["qty"] * (
-                    exit_price - open_trade["entry"]
-                    if open_trade["direction"] == "LONG"
-                    else open_trade["entry"] - exit_price
-                )
-                
-                equity += pnl
-                if pnl < 0:
-                    state["losses"] += 1
-                
-                duration = (ts - open_trade["entry_time"]).total_seconds() / 3600  # hours
-                
-                trades_log.append({
-                    "Symbol": "NIFTY_FUT",
-                    "Entry_Date": open_trade["entry_time"],
-                    "Exit_Date": ts,
-                    "Direction": open_trade["direction"],
-                    "Entry_Price": open_trade["entry"],
-                    "Exit_Price": exit_price,
-                    "Quantity": open_trade["qty"],
-                    "PnL": pnl,
-                    "PnL_Pct": (pnl / (open_trade["qty"] * open_trade["entry"])),
-                    "Duration_Hours": duration,
-                    "Duration_Days": duration / 24,
-                    "Exit_Reason": exit_reason,
-                    "RR": open_trade["rr"],
-                    "Bias": open_trade["bias"],
-                    "Execution_POI": open_trade["execution_poi"],
-                    "Entry_Model": open_trade["entry_model"]
-                })
-                
-                open_trade = None
-            continue
+        # Track portfolio value (flat between trades)
+        portfolio_values[i] = equity
+        cash_values[i] = equity
         
         # Check for new trade entry
+        trade = None
         if state is not None:
-            trade = check_for_trade(row, df, ts, state, equity)
-            if trade:
-                open_trade = trade
+            trade = check_for_trade(bars[i], df, ts, state, equity)
+        if not trade:
+            i += 1
+            continue
+        
+        # Scan forward for the exit bar in compiled code
+        is_long = trade["direction"] == "LONG"
+        exit_idx, exit_price, exit_code = _find_exit(
+            highs, lows, closes, bar_ns, i + 1, is_long,
+            trade["stop"], trade["target"], bar_ns[i] + MAX_HOLD_NS
+        )
+        
+        # Mark-to-market the bars held, including the exit bar
+        held_end = n_bars if exit_idx < 0 else exit_idx + 1
+        held_closes = closes[i + 1:held_end]
+        if is_long:
+            unrealized_pnl = trade["qty"] * (held_closes - trade["entry"])
+        else:
+            unrealized_pnl = trade["qty"] * (trade["entry"] - held_closes)
+        portfolio_values[i + 1:held_end] = equity + unrealized_pnl
+        cash_values[i + 1:held_end] = equity
+        
+        # Trade still open when data ends
+        if exit_idx < 0:
+            break
+        
+        exit_ts = timestamps[exit_idx]
+        exit_day = bar_dates[exit_idx]
+        if exit_day != current_date:
+            current_date = exit_day
+            if exit_day in daily.index:
+                state = new_day_state(exit_day)
+        
+        # Exit trade
+        pnl = trade["qty"] * (
+            exit_price - trade["entry"]
+            if is_long
+            else trade["entry"] - exit_price
+        )
+        
+        equity += pnl
+        if pnl < 0:
+            state["losses"] += 1
+        
+        duration = (exit_ts - trade["entry_time"]).total_seconds() / 3600  # hours
+        
+        trades_log.append({
+            "Symbol": "NIFTY_FUT",
+            "Entry_Date": trade["entry_time"],
+            "Exit_Date": exit_ts,
+            "Direction": trade["direction"],
+            "Entry_Price": trade["entry"],
+            "Exit_Price": exit_price,
+            "Quantity": trade["qty"],
+            "PnL": pnl,
+            "PnL_Pct": (pnl / (trade["qty"] * trade["entry"])),
+            "Duration_Hours": duration,
+            "Duration_Days": duration / 24,
+            "Exit_Reason": EXIT_REASONS[exit_code],
+            "RR": trade["rr"],
+            "Bias": trade["bias"],
+            "Execution_POI": trade["execution_poi"],
+            "Entry_Model": trade["entry_model"]
+        })
+        
+        # No new entry on the exit bar
+        i = exit_idx + 1
+    
+    portfolio_history = pd.DataFrame({
+        "Date": timestamps,
+        "Portfolio_Value": portfolio_values,
+        "Cash": cash_values,
+        "Positions_Value": portfolio_values - cash_values
+    })
     
     # Create results dictionary
     df_result = df.reset_index()
@@ -174,7 +233,7 @@ def run_futures_backtest(
     
     results = {
         "trade_history": pd.DataFrame(trades_log),
-        "portfolio_history": pd.DataFrame(portfolio_history),
+        "portfolio_history": portfolio_history,
         "data": df_result,
         "initial_capital": initial_capital,
         "final_capital": equity
@@ -291,7 +291,15 @@ class Portfolio:
         """Get trade history as DataFrame."""
         if not self.trade_history:
             return pd.DataFrame()
-        return pd.DataFrame(self.trade_history)
+        df = pd.DataFrame(self.trade_history)
+        
+        # Store dates as datetime64 so consumers can use the .dt accessor
+        # directly; Timestamp values are usually inferred as such already
+        for col in ('Entry_Date', 'Exit_Date'):
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col])
+        
+        return df
     
     def get_portfolio_history_df(self) -> pd.DataFrame:
         """Get portfolio value history as DataFrame."""
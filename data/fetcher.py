@@ -8,11 +8,15 @@ from datetime import datetime
 from typing import List, Optional
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Configuration
 USE_MOCK_DATA_FALLBACK = os.getenv('USE_MOCK_DATA', 'true').lower() == 'true'
 
+# Maximum number of symbols fetched concurrently
+MAX_FETCH_WORKERS = 8
+
 
 class EquityDataFetcher:
     """Fetch equity data from the Hackathon API endpoint."""
@@ -42,47 +46,18 @@ class EquityDataFetcher:
         Returns:
             DataFrame with columns: Date, Symbol, Open, High, Low, Close, Volume
         """
-        all_data = []
-        
         # Calculate days_ago from start_date
         start_dt = pd.to_datetime(start_date)
         days_ago = (datetime.now() - start_dt).days + 1  # +1 to include start date
         
-        for symbol in symbols:
-            try:
-                print(f"Fetching data for {symbol} from Hackathon API...")
-                df = self._fetch_from_api(symbol, days_ago, interval)
-                
-                # If no data with calculated days_ago, try with larger windows
-                if df is None or df.empty:
-                    print(f"  Retrying with different date ranges...")
-                    for retry_days in [365, 730, 1000]:
-                        if retry_days <= days_ago:
-                            continue  # Skip if we already tried this or smaller
-                        print(f"  Trying days_ago={retry_days}...")
-                        df = self._fetch_from_api(symbol, retry_days, interval)
-                        if df is not None and not df.empty:
-                            break
-                
-                if df is not None and not df.empty:
-                    # Add symbol column
-                    df['Symbol'] = symbol
-                    
-                    # Filter by date range
-                    df['Date'] = pd.to_datetime(df['Date'])
-                    df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
-                    
-                    if not df.empty:
-                        all_data.append(df)
-                        print(f"  Successfully fetched {len(df)} records for {symbol}")
-                    else:
-                        print(f"  Warning: No data for {symbol} in date range {start_date} to {end_date}")
-                else:
-                    print(f"  Warning: No data received for {symbol}")
-                    
-            except Exception as e:
-                print(f"  Error fetching data for {symbol}: {e}")
-                continue
+        # Fetch symbols concurrently; each request is network-bound
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(symbols)))) as executor:
+            results = list(executor.map(
+                lambda symbol: self._fetch_symbol(symbol, start_date, end_date, days_ago, interval),
+                symbols
+            ))
+        all_data = [df for df in results if df is not None]
+        failed_symbols = [symbol for symbol, df in zip(symbols, results) if df is None]
         
         if not all_data:
             # Try mock data fallback if enabled
@@ -129,7 +104,60 @@ class EquityDataFetcher:
             if col not in combined_df.columns:
                 raise ValueError(f"Missing required column: {col}")
         
-        return combined_df[required_cols]
+        combined_df = combined_df[required_cols]
+        # Symbols that returned no data, so callers can report the partial result
+        combined_df.attrs['failed_symbols'] = failed_symbols
+        return combined_df
+    
+    def _fetch_symbol(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        days_ago: int,
+        interval: str = "day"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch and date-filter data for a single symbol.
+        
+        Returns:
+            DataFrame for the symbol, or None if no data was available
+        """
+        try:
+            print(f"Fetching data for {symbol} from Hackathon API...")
+            df = self._fetch_from_api(symbol, days_ago, interval)
+            
+            # If no data with calculated days_ago, try with larger windows
+            if df is None or df.empty:
+                print(f"  Retrying with different date ranges...")
+                for retry_days in [365, 730, 1000]:
+                    if retry_days <= days_ago:
+                        continue  # Skip if we already tried this or smaller
+                    print(f"  Trying days_ago={retry_days}...")
+                    df = self._fetch_from_api(symbol, retry_days, interval)
+                    if df is not None and not df.empty:
+                        break
+            
+            if df is not None and not df.empty:
+                # Add symbol column
+                df['Symbol'] = symbol
+                
+                # Filter by date range
+                df['Date'] = pd.to_datetime(df['Date'])
+                df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
+                
+                if not df.empty:
+                    print(f"  Successfully fetched {len(df)} records for {symbol}")
+                    return df
+                else:
+                    print(f"  Warning: No data for {symbol} in date range {start_date} to {end_date}")
+            else:
+                print(f"  Warning: No data received for {symbol}")
+                
+        except Exception as e:
+            print(f"  Error fetching data for {symbol}: {e}")
+        
+        return None
     
     def _fetch_from_api(
         self, 
@@ -7,6 +7,10 @@ import pandas as pd
 from pathlib import Path
 
 
+# Default pre-stored NIFTY futures minute data
+DEFAULT_DATA_FILE = Path(__file__).parent.parent / "futures" / "data" / "futures_minute_clean.csv"
+
+
 def load_futures_data(data_file=None):
     """
     Load futures data from CSV file.
@@ -18,9 +22,7 @@ def load_futures_data(data_file=None):
         pd.DataFrame: DataFrame with datetime index and OHLC columns
     """
     if data_file is None:
-        # Default to futures/data/futures_minute_clean.csv
-        base_dir = Path(__file__).parent.parent
-        data_file = base_dir / "futures" / "data" / "futures_minute_clean.csv"
+        data_file = DEFAULT_DATA_FILE
     
     if not os.path.exists(data_file):
         raise FileNotFoundError(
@@ -28,8 +30,10 @@ def load_futures_data(data_file=None):
             "Please ensure futures data is available in the futures/data/ directory."
         )
     
-    # Load data
-    df = pd.read_csv(data_file, parse_dates=["datetime"])
+    # Load data with the multithreaded Arrow parser. Arrow already parses
+    # ISO timestamps; the explicit format avoids inference if it does not.
+    df = pd.read_csv(data_file, engine="pyarrow")
+    df["datetime"] = pd.to_datetime(df["datetime"], format="%Y-%m-%d %H:%M:%S")
     df.set_index("datetime", inplace=True)
     df["date"] = df.index.date
     
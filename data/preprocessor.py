@@ -24,8 +24,9 @@ class DataPreprocessor:
         """
         df = df.copy()
         
-        # Ensure Date is datetime
-        df['Date'] = pd.to_datetime(df['Date'])
+        # Ensure Date is datetime (skip the re-parse if it already is)
+        if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            df['Date'] = pd.to_datetime(df['Date'])
         
         # Sort by symbol and date
         df = df.sort_values(['Symbol', 'Date']).reset_index(drop=True)
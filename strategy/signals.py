@@ -32,24 +32,27 @@ class SignalGenerator:
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate buy/sell signals for the dataframe."""
         df = df.copy()
-        df['Signal'] = 0
-        df['Signal_Strength'] = 0.0
+        signal = np.zeros(len(df), dtype=np.int64)
+        strength = np.zeros(len(df))
         
-        for symbol in df['Symbol'].unique():
-            mask = df['Symbol'] == symbol
-            symbol_df = df[mask].copy()
+        # Row positions per symbol from one grouping pass, instead of a
+        # boolean mask over the whole frame for every symbol
+        for rows in df.groupby('Symbol', sort=False).indices.values():
+            symbol_df = df.iloc[rows]
             
             buy_signals = self._generate_buy_signals(symbol_df)
             sell_signals = self._generate_sell_signals(symbol_df)
             
-            df.loc[mask, 'Signal'] = 0
-            df.loc[mask & buy_signals, 'Signal'] = 1
-            df.loc[mask & sell_signals, 'Signal'] = -1
-            
-            df.loc[mask, 'Signal_Strength'] = self._calculate_signal_strength(
-                symbol_df, buy_signals, sell_signals
+            # Sell takes precedence where both fire
+            signal[rows] = np.where(
+                sell_signals.to_numpy(), -1, np.where(buy_signals.to_numpy(), 1, 0)
             )
+            strength[rows] = self._calculate_signal_strength(
+                symbol_df, buy_signals, sell_signals
+            ).to_numpy()
         
+        df['Signal'] = signal
+        df['Signal_Strength'] = strength
         return df
     
     def _generate_buy_signals(self, df: pd.DataFrame) -> pd.Series:
@@ -167,39 +170,33 @@ class SignalGenerator:
         sell_signals: pd.Series
     ) -> pd.Series:
         """Calculate signal strength (0-1)."""
-        strength = pd.Series(0.5, index=df.index)
-        
-        for idx in buy_signals[buy_signals].index:
-            try:
-                score = 0
-                if df.loc[idx, 'MA_Short'] > df.loc[idx, 'MA_Long']:
-                    score += 1
-                if df.loc[idx, 'MACD'] > df.loc[idx, 'MACD_Signal']:
-                    score += 1
-                if df.loc[idx, 'RSI'] < 60:
-                    score += 1
-                if df.loc[idx, 'Close'] > df.loc[idx, 'Open']:
-                    score += 1
-                strength.loc[idx] = score / 4
-            except:
-                pass
-        
-        for idx in sell_signals[sell_signals].index:
-            try:
-                score = 0
-                if df.loc[idx, 'MA_Short'] < df.loc[idx, 'MA_Long']:
-                    score += 1
-                if df.loc[idx, 'MACD'] < df.loc[idx, 'MACD_Signal']:
-                    score += 1
-                if df.loc[idx, 'RSI'] > 50:
-                    score += 1
-                if df.loc[idx, 'Close'] < df.loc[idx, 'Open']:
-                    score += 1
-                strength.loc[idx] = score / 4
-            except:
-                pass
-        
-        return strength
+        ma_short = df['MA_Short'].to_numpy()
+        ma_long = df['MA_Long'].to_numpy()
+        macd = df['MACD'].to_numpy()
+        macd_signal = df['MACD_Signal'].to_numpy()
+        rsi = df['RSI'].to_numpy()
+        close = df['Close'].to_numpy()
+        open_ = df['Open'].to_numpy()
+        
+        # Each score counts how many of four confirming conditions hold
+        buy_score = (
+            (ma_short > ma_long).astype(int)
+            + (macd > macd_signal)
+            + (rsi < 60)
+            + (close > open_)
+        ) / 4
+        sell_score = (
+            (ma_short < ma_long).astype(int)
+            + (macd < macd_signal)
+            + (rsi > 50)
+            + (close < open_)
+        ) / 4
+        
+        # Sell scores take precedence where both signals fire
+        strength = np.where(buy_signals.to_numpy(), buy_score, 0.5)
+        strength = np.where(sell_signals.to_numpy(), sell_score, strength)
+        
+        return pd.Series(strength, index=df.index)
 
 
 def generate_signals(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
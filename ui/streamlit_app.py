@@ -6,8 +6,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+import io
+import math
+import os
 import sys
+import uuid
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -17,11 +22,12 @@ if str(parent_dir) not in sys.path:
 
 from data.fetcher import fetch_equity_data
 from data.preprocessor import preprocess_data
-from data.futures_fetcher import load_futures_data, get_available_date_range
+from data.futures_fetcher import DEFAULT_DATA_FILE, load_futures_data
 from strategy.indicators import add_indicators
 from strategy.signals import generate_signals
+from utils.downsample import lttb_indices
+from utils.results_store import load_results, results_key, save_results
 from backtesting.engine import run_backtest
-from backtesting.futures_engine import run_futures_backtest
 from backtesting.metrics import PerformanceMetrics
 
 # Page configuration
@@ -33,6 +39,602 @@ st.set_page_config(
 )
 
 
+RESULT_VIEWS = [
+    "📈 Price Charts", "💰 Portfolio Performance", "📊 Trade Analysis", "⚠️ Risk Metrics", "📋 Trade Log"
+]
+
+# Rows per page in the trade log view
+TRADE_LOG_PAGE_SIZE = 200
+
+# Display formats for trade log columns (applied client-side by st.dataframe;
+# PnL_Pct is scaled to percent before display)
+TRADE_LOG_COLUMN_CONFIG = {
+    'Entry_Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+    'Exit_Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+    'Entry_Price': st.column_config.NumberColumn(format='₹%.2f'),
+    'Exit_Price': st.column_config.NumberColumn(format='₹%.2f'),
+    'PnL': st.column_config.NumberColumn(format='₹%.2f'),
+    'PnL_Pct': st.column_config.NumberColumn(format='%.2f%%')
+}
+
+# Runs kept by each per-run (results_token keyed) cache; entries for older
+# runs are evicted instead of accumulating until the server restarts
+RUN_CACHE_ENTRIES = 8
+
+# Upper bound on candles sent to the browser for the price chart
+MAX_CHART_CANDLES = 2000
+
+# Dark theme shared by every figure, registered once per process (the
+# script reruns on every interaction) instead of being named in each
+# figure's layout
+if 'trading_dark' not in pio.templates:
+    pio.templates['trading_dark'] = go.layout.Template(pio.templates['plotly_dark'])
+    pio.templates.default = 'trading_dark'
+
+
+METRIC_GRID_CSS = """
+<style>
+.metric-grid { display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem 2rem; }
+.metric-section h4 { margin-bottom: 0.5rem; }
+.metric { padding: 0.4rem 0; }
+.metric-label { font-size: 0.875rem; opacity: 0.7; }
+.metric-value { font-size: 1.75rem; line-height: 1.3; }
+</style>
+"""
+
+
+def render_metric_grid(sections):
+    """
+    Render grouped metrics as a single HTML block.
+    
+    Args:
+        sections: List of (heading, [(label, value), ...]) tuples
+        
+    Returns:
+        str: HTML markup for st.markdown(..., unsafe_allow_html=True)
+    """
+    parts = [METRIC_GRID_CSS, '<div class="metric-grid">']
+    for heading, rows in sections:
+        parts.append(f'<div class="metric-section"><h4>{heading}</h4>')
+        for label, value in rows:
+            parts.append(
+                f'<div class="metric"><div class="metric-label">{label}</div>'
+                f'<div class="metric-value">{value}</div></div>'
+            )
+        parts.append('</div>')
+    parts.append('</div>')
+    return "".join(parts)
+
+
+@st.cache_data(max_entries=RUN_CACHE_ENTRIES, show_spinner=False)
+def exit_reason_breakdown(results_token, _trade_df):
+    """
+    Count trades per exit reason.
+    
+    Args:
+        results_token: Identifier of the backtest run, used as the cache key
+        _trade_df: Trade history DataFrame with an Exit_Reason column
+            (leading underscore excludes it from cache hashing)
+        
+    Returns:
+        tuple: (labels array, int32 counts array)
+    """
+    # Counting categorical codes avoids hashing every reason string
+    counts = _trade_df['Exit_Reason'].astype('category').value_counts()
+    return counts.index.to_numpy(), counts.to_numpy().astype('int32')
+
+
+@st.cache_data(max_entries=RUN_CACHE_ENTRIES, show_spinner=False)
+def trade_log_csv(results_token, _trade_df):
+    """
+    Encode the trade history as CSV for download.
+    
+    Args:
+        results_token: Identifier of the backtest run, used as the cache key
+        _trade_df: Trade history DataFrame
+            (leading underscore excludes it from cache hashing)
+        
+    Returns:
+        bytes: UTF-8 CSV with a header row
+    """
+    # pandas writes midnight timestamps as plain dates and quotes only the
+    # fields that need it; the per-run cache means this runs once per run
+    return _trade_df.to_csv(index=False).encode('utf-8')
+
+
+def run_figure_store(results_token):
+    """
+    Session-state store of figures built for the current run.
+    
+    The store is cleared when a new run's token arrives, so each figure is
+    built once per run and later reruns pass the same object straight to
+    st.plotly_chart.
+    
+    Args:
+        results_token: Identifier of the backtest run
+        
+    Returns:
+        dict: Figure key -> stored figure
+    """
+    if st.session_state.get('run_figs_token') != results_token:
+        st.session_state.run_figs = {}
+        st.session_state.run_figs_token = results_token
+    return st.session_state.run_figs
+
+
+def run_figure(results_token, name, build):
+    """
+    Figure for the current run, built on first use.
+    
+    Args:
+        results_token: Identifier of the backtest run
+        name: Key of the figure within the run
+        build: Zero-argument callable returning the figure
+        
+    Returns:
+        go.Figure: The stored figure
+    """
+    run_figs = run_figure_store(results_token)
+    if name not in run_figs:
+        run_figs[name] = build()
+    return run_figs[name]
+
+
+def portfolio_figure(initial_capital, dates, portfolio_df):
+    """Build the portfolio growth figure for a run."""
+    fig = go.Figure(
+        data=[
+            # Portfolio value
+            go.Scattergl(
+                x=dates,
+                y=portfolio_df['Portfolio_Value'].to_numpy(),
+                name='Portfolio Value',
+                line=dict(color='#00ff88', width=3),
+                fill='tozeroy',
+                fillcolor='rgba(0, 255, 136, 0.1)'
+            )
+        ],
+        layout=dict(
+            title="Portfolio Growth",
+            xaxis_title="Date",
+            yaxis_title="Value (₹)",
+            height=500,
+            hovermode='x unified'
+        )
+    )
+    
+    # Benchmark (buy and hold initial value)
+    fig.add_hline(
+        y=initial_capital,
+        line_dash="dash",
+        line_color="orange",
+        annotation_text="Initial Capital",
+        annotation_position="right"
+    )
+    
+    return fig
+
+
+def drawdown_figure(dates, drawdown_df):
+    """Build the underwater (drawdown %) figure for a run."""
+    fig_dd = go.Figure(
+        data=[
+            go.Scattergl(
+                x=dates,
+                y=drawdown_df['Drawdown'].to_numpy() * 100,
+                name='Drawdown',
+                line=dict(color='#ff3366', width=2),
+                fill='tozeroy',
+                fillcolor='rgba(255, 51, 102, 0.2)'
+            )
+        ],
+        layout=dict(
+            title="Underwater Plot (Drawdown %)",
+            xaxis_title="Date",
+            yaxis_title="Drawdown (%)",
+            height=400,
+            hovermode='x unified'
+        )
+    )
+    
+    return fig_dd
+
+
+def allocation_figure(dates, portfolio_df):
+    """Build the cash vs invested allocation figure for a run."""
+    # Scattergl has no stackgroup, so the invested band is drawn on top of
+    # cash explicitly and hover shows the unstacked value
+    # float32 halves the plotted payload with no visible precision loss
+    cash = portfolio_df['Cash'].to_numpy(dtype='float32')
+    invested = portfolio_df['Positions_Value'].to_numpy(dtype='float32')
+    
+    fig_alloc = go.Figure(
+        data=[
+            go.Scattergl(
+                x=dates,
+                y=cash,
+                name='Cash',
+                line=dict(color='cyan', width=2),
+                fill='tozeroy'
+            ),
+            go.Scattergl(
+                x=dates,
+                y=cash + invested,
+                customdata=invested,
+                hovertemplate='%{customdata:,.2f}',
+                name='Invested',
+                line=dict(color='#00ff88', width=2),
+                fill='tonexty'
+            )
+        ],
+        layout=dict(
+            title="Portfolio Allocation",
+            xaxis_title="Date",
+            yaxis_title="Value (₹)",
+            height=400,
+            hovermode='x unified'
+        )
+    )
+    
+    return fig_alloc
+
+
+def pnl_figure(trade_df):
+    """Build the per-trade P&L bar figure for a run."""
+    # Masked arrays instead of filtered frames; Plotly skips the NaN bars
+    pnl = trade_df['PnL'].to_numpy()
+    trade_numbers = trade_df.index.to_numpy()
+    
+    fig_pnl = go.Figure(
+        data=[
+            go.Bar(
+                x=trade_numbers,
+                y=np.where(pnl > 0, pnl, np.nan),
+                name='Wins',
+                marker_color='#00ff88'
+            ),
+            go.Bar(
+                x=trade_numbers,
+                y=np.where(pnl < 0, pnl, np.nan),
+                name='Losses',
+                marker_color='#ff3366'
+            )
+        ],
+        layout=dict(
+            title="Trade P&L Distribution",
+            xaxis_title="Trade Number",
+            yaxis_title="P&L (₹)",
+            height=400
+        )
+    )
+    
+    return fig_pnl
+
+
+def duration_figure(trade_df):
+    """Build the trade duration histogram for a run."""
+    # Bin server-side so only the bar heights are sent to the browser. At
+    # most 20 bins, each a whole number of days wide
+    durations = trade_df['Duration_Days'].to_numpy()
+    lo, hi = int(durations.min()), int(durations.max())
+    step = max(1, math.ceil((hi - lo + 1) / 20))
+    counts, edges = np.histogram(durations, bins=np.arange(lo, hi + step + 1, step))
+    
+    fig_duration = go.Figure(
+        data=[
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                name='Duration',
+                marker_color='#00d4ff'
+            )
+        ],
+        layout=dict(
+            title="Trade Duration Distribution",
+            xaxis_title="Days Held",
+            yaxis_title="Number of Trades",
+            height=400
+        )
+    )
+    
+    return fig_duration
+
+
+def downsample_ohlc(df, x_col, ohlc_cols, volume_col=None, max_bars=MAX_CHART_CANDLES):
+    """
+    Aggregate consecutive bars into buckets for charting.
+    
+    Each bucket keeps the first open, max high, min low and last close
+    (and summed volume), so price extremes survive the reduction.
+    
+    Args:
+        df: DataFrame with OHLC columns
+        x_col: Timestamp column
+        ohlc_cols: List of [open, high, low, close] column names
+        volume_col: Optional volume column name
+        max_bars: Maximum number of bars to keep
+        
+    Returns:
+        pd.DataFrame: df itself if already small enough, else the aggregated bars
+    """
+    if len(df) <= max_bars:
+        return df
+    
+    bucket_size = -(-len(df) // max_bars)
+    buckets = np.arange(len(df)) // bucket_size
+    
+    open_col, high_col, low_col, close_col = ohlc_cols
+    agg = {
+        x_col: 'first',
+        open_col: 'first',
+        high_col: 'max',
+        low_col: 'min',
+        close_col: 'last'
+    }
+    if volume_col is not None:
+        agg[volume_col] = 'sum'
+    
+    return df.groupby(buckets).agg(agg)
+
+
+def minmax_indices(values, max_points=MAX_CHART_CANDLES):
+    """
+    Pick row positions that preserve the shape of a long line series.
+    
+    The series is split into max_points // 2 buckets and the positions of
+    each bucket's minimum and maximum are kept, so peaks and troughs stay
+    visible after the reduction.
+    
+    Args:
+        values: 1-D array without NaNs used to choose the points
+        max_points: Maximum number of positions to return
+        
+    Returns:
+        np.ndarray: Sorted positions into values
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    
+    bucket_size = -(-n // (max_points // 2))
+    n_buckets = -(-n // bucket_size)
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = values
+    padded = padded.reshape(n_buckets, bucket_size)
+    
+    offsets = np.arange(n_buckets) * bucket_size
+    return np.unique(np.concatenate([
+        offsets + np.nanargmin(padded, axis=1),
+        offsets + np.nanargmax(padded, axis=1)
+    ]))
+
+
+@st.cache_data(show_spinner=False)
+def equity_template_xlsx():
+    """Sample equity upload template as Excel bytes, built once per process."""
+    sample_buffer = io.BytesIO()
+    dates = pd.date_range('2023-01-01', '2023-01-10', freq='B')
+    sample_data = []
+    for symbol in ['RELIANCE', 'TCS']:
+        base_price = 2000 if symbol == 'RELIANCE' else 3500
+        for date in dates:
+            sample_data.append({
+                'Date': date,
+                'Symbol': symbol,
+                'Open': base_price + 10,
+                'High': base_price + 20,
+                'Low': base_price - 10,
+                'Close': base_price + 5,
+                'Volume': 1000000
+            })
+    sample_df = pd.DataFrame(sample_data)
+    sample_df.to_excel(sample_buffer, index=False, engine='openpyxl')
+    return sample_buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def futures_template_xlsx():
+    """Sample futures upload template as Excel bytes, built once per process."""
+    sample_buffer = io.BytesIO()
+    dates = pd.date_range('2025-12-01', '2025-12-10', freq='B')
+    sample_data = []
+    base_price = 26000
+    for date in dates:
+        sample_data.append({
+            'date': date,
+            'time': '00:00:00',
+            'tradingsymbol': 'NIFTY',
+            'open': base_price + 10,
+            'high': base_price + 50,
+            'low': base_price - 30,
+            'close': base_price + 20,
+            'volume': 0
+        })
+    sample_df = pd.DataFrame(sample_data)
+    sample_df.to_excel(sample_buffer, index=False, engine='openpyxl')
+    return sample_buffer.getvalue()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_fetch_equity_data(symbols, start_date, end_date):
+    """
+    Cached wrapper around fetch_equity_data.
+    
+    Args:
+        symbols: Tuple of stock symbols (hashable cache key)
+        start_date: Start date in 'YYYY-MM-DD' format
+        end_date: End date in 'YYYY-MM-DD' format
+    """
+    return fetch_equity_data(list(symbols), start_date, end_date)
+
+
+@st.cache_data(show_spinner=False)
+def cached_preprocess_data(raw_data):
+    """Cached wrapper around preprocess_data."""
+    return preprocess_data(raw_data)
+
+
+@st.cache_data(show_spinner=False)
+def cached_add_indicators(clean_data, short_ma, long_ma, rsi_period, macd_fast, macd_slow, macd_signal):
+    """Cached wrapper around add_indicators, keyed on data and indicator periods."""
+    return add_indicators(
+        clean_data,
+        short_ma=short_ma,
+        long_ma=long_ma,
+        rsi_period=rsi_period,
+        macd_fast=macd_fast,
+        macd_slow=macd_slow,
+        macd_signal=macd_signal
+    )
+
+
+@st.cache_data(show_spinner=False)
+def cached_generate_signals(df_with_indicators, rsi_oversold, rsi_overbought):
+    """Cached wrapper around generate_signals, keyed on data and RSI thresholds."""
+    return generate_signals(
+        df_with_indicators,
+        rsi_oversold=rsi_oversold,
+        rsi_overbought=rsi_overbought
+    )
+
+
+def run_equity_pipeline(raw_data, params, on_step=None):
+    """
+    Preprocess, add indicators, generate signals and backtest equity data.
+    
+    Args:
+        raw_data: Raw OHLCV DataFrame
+        params: Dictionary of the sidebar strategy and risk parameters
+        on_step: Optional callable receiving a label as each stage starts
+        
+    Returns:
+        dict: Backtest results
+    """
+    on_step = on_step or (lambda label: None)
+    
+    on_step("🧹 Preprocessing data...")
+    clean_data = cached_preprocess_data(raw_data)
+    
+    on_step("📊 Calculating technical indicators...")
+    df_with_indicators = cached_add_indicators(
+        clean_data,
+        params['short_ma'],
+        params['long_ma'],
+        params['rsi_period'],
+        params['macd_fast'],
+        params['macd_slow'],
+        params['macd_signal']
+    )
+    
+    on_step("🎯 Generating trading signals...")
+    df_with_signals = cached_generate_signals(
+        df_with_indicators,
+        params['rsi_oversold'],
+        params['rsi_overbought']
+    )
+    
+    on_step("⚙️ Running backtest simulation...")
+    return run_backtest(
+        df_with_signals,
+        initial_capital=params['initial_capital'],
+        position_size=params['position_size'],
+        max_positions=params['max_positions'],
+        stop_loss_pct=params['stop_loss'],
+        take_profit_pct=params['take_profit']
+    )
+
+
+class MockDataFallback(Exception):
+    """Raised by cached_equity_backtest when the fetch fell back to mock data."""
+
+
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)
+def cached_equity_backtest(symbols, start_date, end_date, params, cache_day):
+    """
+    Full fetch-to-backtest run for API/mock data, persisted to disk so
+    identical runs are served across sessions and server restarts.
+    
+    Args:
+        symbols: Tuple of stock symbols
+        start_date: Start date in 'YYYY-MM-DD' format
+        end_date: End date in 'YYYY-MM-DD' format
+        params: Dictionary of the sidebar strategy and risk parameters
+        cache_day: Today's date; persisted entries ignore ttl, so this
+            keeps fetched data from being reused past the day it was fetched
+        
+    Returns:
+        tuple: (backtest results, attrs of the fetched data)
+        
+    Raises:
+        MockDataFallback: If the API returned no data and the fetcher fell
+            back to mock data. Raising keeps the call out of the disk cache;
+            callers run the in-memory stage caches instead.
+    """
+    raw_data = cached_fetch_equity_data(symbols, start_date, end_date)
+    if raw_data.attrs.get('is_mock_data'):
+        raise MockDataFallback()
+    return run_equity_pipeline(raw_data, params), dict(raw_data.attrs)
+
+
+@st.cache_data(show_spinner=False)
+def cached_load_futures_data(data_file, mtime):
+    """
+    Cached wrapper around load_futures_data.
+    
+    Args:
+        data_file: Path to the futures data CSV
+        mtime: File modification time, so edits to the file invalidate the cache
+    """
+    return load_futures_data(data_file)
+
+
+@st.cache_resource(max_entries=RUN_CACHE_ENTRIES, show_spinner=False)
+def cached_performance_metrics(results_token, _results):
+    """
+    Shared PerformanceMetrics instance for a backtest run.
+    
+    Args:
+        results_token: Identifier of the backtest run, used as the cache key
+        _results: Backtest results dictionary (not hashed)
+    """
+    return PerformanceMetrics(_results)
+
+
+@st.cache_data(max_entries=RUN_CACHE_ENTRIES, show_spinner=False)
+def cached_drawdown_series(results_token, _results):
+    """
+    Drawdown series for a backtest run, computed once per run.
+    
+    Args:
+        results_token: Identifier of the backtest run, used as the cache key
+        _results: Backtest results dictionary (not hashed)
+        
+    Returns:
+        pd.DataFrame: Date and float32 Drawdown columns
+    """
+    drawdown_df = cached_performance_metrics(results_token, _results).get_drawdown_series()
+    return drawdown_df.astype({'Drawdown': 'float32'})
+
+
+def chart_frames_by_symbol(data):
+    """
+    Split backtest data into per-symbol frames for the price charts.
+    
+    Float columns are downcast to float32, halving the payload of every
+    chart built from them. The backtest itself runs on float64.
+    
+    Args:
+        data: Backtest results data with a Symbol column
+        
+    Returns:
+        dict: Symbol -> DataFrame
+    """
+    float_cols = data.select_dtypes('float64').columns
+    data = data.astype({col: 'float32' for col in float_cols})
+    return dict(tuple(data.groupby('Symbol', sort=False)))
+
+
 
 # Title and description
 st.markdown("<h1>📈 Algorithmic Trading System</h1>", unsafe_allow_html=True)
@@ -86,45 +688,30 @@ if market_type == "Equity":
                 "- Volume"
             )
             
-            # Create and offer sample template download
-            import io
-            
-            # Generate sample in memory
-            sample_buffer = io.BytesIO()
-            dates = pd.date_range('2023-01-01', '2023-01-10', freq='B')
-            sample_data = []
-            for symbol in ['RELIANCE', 'TCS']:
-                base_price = 2000 if symbol == 'RELIANCE' else 3500
-                for date in dates:
-                    sample_data.append({
-                        'Date': date,
-                        'Symbol': symbol,
-                        'Open': base_price + 10,
-                        'High': base_price + 20,
-                        'Low': base_price - 10,
-                        'Close': base_price + 5,
-                        'Volume': 1000000
-                    })
-            sample_df = pd.DataFrame(sample_data)
-            sample_df.to_excel(sample_buffer, index=False, engine='openpyxl')
-            sample_buffer.seek(0)
-            
+            # Offer the sample template (built once and cached)
             st.sidebar.download_button(
                 label="📥 Download Sample Template",
-                data=sample_buffer,
+                data=equity_template_xlsx(),
                 file_name="sample_trading_data.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 help="Download a sample Excel file to see the required format"
             )
+        
+        # Parameters sit in a form so adjusting them does not rerun the app;
+        # they are submitted together by the Run Backtest button
+        params_form = st.sidebar.form("strategy_params", border=False)
     
     else:  # API/Mock Data
-        st.sidebar.markdown("### 📊 Select Stocks")
+        # Stock selection joins the parameter form (see above)
+        params_form = st.sidebar.form("strategy_params", border=False)
+        
+        params_form.markdown("### 📊 Select Stocks")
         available_stocks = [
             'RELIANCE', 'TCS', 'INFY', 'HDFCBANK', 'ICICIBANK',
             'SBIN', 'BHARTIARTL', 'ITC', 'KOTAKBANK', 'LT'
         ]
         
-        selected_stocks = st.sidebar.multiselect(
+        selected_stocks = params_form.multiselect(
             "Choose stocks to analyze",
             options=available_stocks,
             default=['RELIANCE'],
@@ -132,8 +719,8 @@ if market_type == "Equity":
         )
     
     # Date range
-    st.sidebar.markdown("### 📅 Date Range")
-    col1, col2 = st.sidebar.columns(2)
+    params_form.markdown("### 📅 Date Range")
+    col1, col2 = params_form.columns(2)
     with col1:
         start_date = st.date_input(
             "Start Date",
@@ -146,25 +733,25 @@ if market_type == "Equity":
         )
     
     # Strategy parameters
-    st.sidebar.markdown("### 🎯 Strategy Parameters")
+    params_form.markdown("### 🎯 Strategy Parameters")
     
-    with st.sidebar.expander("Moving Averages", expanded=False):
+    with params_form.expander("Moving Averages", expanded=False):
         short_ma = st.slider("Short MA Period", 5, 30, 10)
         long_ma = st.slider("Long MA Period", 20, 60, 30)
     
-    with st.sidebar.expander("RSI", expanded=False):
+    with params_form.expander("RSI", expanded=False):
         rsi_period = st.slider("RSI Period", 7, 21, 14)
         rsi_oversold = st.slider("RSI Oversold", 20, 40, 30)
         rsi_overbought = st.slider("RSI Overbought", 60, 80, 70)
     
-    with st.sidebar.expander("MACD", expanded=False):
+    with params_form.expander("MACD", expanded=False):
         macd_fast = st.slider("MACD Fast", 8, 16, 12)
         macd_slow = st.slider("MACD Slow", 20, 30, 26)
         macd_signal = st.slider("MACD Signal", 7, 12, 9)
     
     # Risk management for Equity
-    st.sidebar.markdown("### ⚠️ Risk Management")
-    initial_capital = st.sidebar.number_input(
+    params_form.markdown("### ⚠️ Risk Management")
+    initial_capital = params_form.number_input(
         "Initial Capital (₹)",
         min_value=100000,
         max_value=10000000,
@@ -173,7 +760,7 @@ if market_type == "Equity":
         format="%d"
     )
     
-    position_size = st.sidebar.slider(
+    position_size = params_form.slider(
         "Position Size (%)",
         min_value=5,
         max_value=50,
@@ -181,14 +768,14 @@ if market_type == "Equity":
         help="Percentage of portfolio per trade"
     ) / 100
     
-    max_positions = st.sidebar.slider(
+    max_positions = params_form.slider(
         "Max Concurrent Positions",
         min_value=1,
         max_value=5,
         value=4
     )
     
-    stop_loss = st.sidebar.slider(
+    stop_loss = params_form.slider(
         "Stop Loss (%)",
         min_value=1,
         max_value=15,
@@ -196,7 +783,7 @@ if market_type == "Equity":
         help="Percentage below entry price"
     ) / 100
     
-    take_profit = st.sidebar.slider(
+    take_profit = params_form.slider(
         "Take Profit (%)",
     min_value=5,
     max_value=30,
@@ -237,30 +824,10 @@ else:  # Futures mode
                 "- time (optional)"
             )
             
-            # Sample template for futures
-            import io
-            sample_buffer = io.BytesIO()
-            dates = pd.date_range('2025-12-01', '2025-12-10', freq='B')
-            sample_data = []
-            base_price = 26000
-            for date in dates:
-                sample_data.append({
-                    'date': date,
-                    'time': '00:00:00',
-                    'tradingsymbol': 'NIFTY',
-                    'open': base_price + 10,
-                    'high': base_price + 50,
-                    'low': base_price - 30,
-                    'close': base_price + 20,
-                    'volume': 0
-                })
-            sample_df = pd.DataFrame(sample_data)
-            sample_df.to_excel(sample_buffer, index=False, engine='openpyxl')
-            sample_buffer.seek(0)
-            
+            # Sample template for futures (built once and cached)
             st.sidebar.download_button(
                 label="📥 Download Futures Template",
-                data=sample_buffer,
+                data=futures_template_xlsx(),
                 file_name="sample_nifty_futures.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 help="Download a sample Excel file for NIFTY futures data"
@@ -271,10 +838,13 @@ else:  # Futures mode
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🎯 Futures Trading")
     
+    # Parameters are submitted together by the Run Backtest button
+    params_form = st.sidebar.form("strategy_params", border=False)
+    
     # Strategy parameters for Futures
-    st.sidebar.markdown("### 🎯 Strategy Parameters")
+    params_form.markdown("### 🎯 Strategy Parameters")
     
-    with st.sidebar.expander("Risk-Reward Settings", expanded=True):
+    with params_form.expander("Risk-Reward Settings", expanded=True):
         min_rr = st.slider(
             "Minimum R:R Ratio",
             min_value=1.0,
@@ -292,7 +862,7 @@ else:  # Futures mode
             help="Minimum stop loss distance in points"
         )
     
-    with st.sidebar.expander("Trade Management", expanded=True):
+    with params_form.expander("Trade Management", expanded=True):
         max_daily_losses = st.slider(
             "Max Daily Losses",
             min_value=1,
@@ -320,8 +890,8 @@ else:  # Futures mode
         ) / 100
     
     # Capital for Futures
-    st.sidebar.markdown("### 💰 Capital")
-    initial_capital = st.sidebar.number_input(
+    params_form.markdown("### 💰 Capital")
+    initial_capital = params_form.number_input(
         "Initial Capital (₹)",
         min_value=100000,
         max_value=10000000,
@@ -330,19 +900,76 @@ else:  # Futures mode
         format="%d"
     )
 
-# Run backtest button
-st.sidebar.markdown("---")
-run_backtest_button = st.sidebar.button(
+# Run backtest button (submits the parameter form)
+params_form.markdown("---")
+run_backtest_button = params_form.form_submit_button(
     "🚀 Run Backtest",
     use_container_width=True,
     type="primary"
 )
 
+# Parameters of the run the sidebar describes. Runs on API/mock or stored
+# data are persisted under a key built from these; uploaded data never is.
+# The key is only needed to run a backtest or to restore one, so plain
+# reruns over displayed results skip it (and the futures file stat).
+needs_run_key = run_backtest_button or st.session_state.get('backtest_results') is None
+run_source = None
+if market_type == "Equity":
+    run_params = {
+        'short_ma': short_ma, 'long_ma': long_ma, 'rsi_period': rsi_period,
+        'rsi_oversold': rsi_oversold, 'rsi_overbought': rsi_overbought,
+        'macd_fast': macd_fast, 'macd_slow': macd_slow, 'macd_signal': macd_signal,
+        'initial_capital': initial_capital, 'position_size': position_size,
+        'max_positions': max_positions, 'stop_loss': stop_loss,
+        'take_profit': take_profit
+    }
+    if needs_run_key and data_source == "API/Mock Data":
+        run_source = (tuple(sorted(selected_stocks)), str(start_date), str(end_date))
+else:
+    run_params = {
+        'initial_capital': initial_capital, 'min_rr': min_rr,
+        'max_daily_losses': max_daily_losses, 'min_stop_points': min_stop_points,
+        'risk_percent_bullish': risk_percent_bullish,
+        'risk_percent_neutral': risk_percent_neutral
+    }
+    if needs_run_key and futures_data_source == "Use Stored Data":
+        try:
+            run_source = (str(DEFAULT_DATA_FILE), os.path.getmtime(DEFAULT_DATA_FILE))
+        except OSError:
+            # Missing data file: the run handler reports it, nothing to restore
+            run_source = None
+run_key = (
+    results_key({'market_type': market_type, 'source': run_source, **run_params})
+    if run_source is not None else None
+)
+
 # Initialize session state
 if 'backtest_results' not in st.session_state:
     st.session_state.backtest_results = None
 if 'metrics' not in st.session_state:
     st.session_state.metrics = None
+if 'results_token' not in st.session_state:
+    st.session_state.results_token = None
+if 'run_params' not in st.session_state:
+    st.session_state.run_params = None
+if 'price_by_symbol' not in st.session_state:
+    st.session_state.price_by_symbol = None
+
+# Nothing run in this session yet: restore a persisted run matching the
+# sidebar, if any
+if st.session_state.backtest_results is None and run_key is not None:
+    stored_results, stored_market_type, stored_params = load_results(run_key)
+    if stored_results is not None:
+        results_token = uuid.uuid4().hex
+        st.session_state.backtest_results = stored_results
+        st.session_state.metrics = (
+            cached_performance_metrics(results_token, stored_results).calculate_all_metrics()
+            if not stored_results['trade_history'].empty else {}
+        )
+        st.session_state.market_type = stored_market_type
+        st.session_state.run_params = stored_params
+        st.session_state.results_token = results_token
+        st.session_state.price_by_symbol = chart_frames_by_symbol(stored_results['data'])
 
 # Run backtest
 if run_backtest_button:
@@ -352,123 +979,126 @@ if run_backtest_button:
             st.error("⚠️ Please select at least one stock!")
         elif data_source == "Upload Excel" and uploaded_file is None:
             st.error("⚠️ Please upload an Excel file!")
+        elif data_source == "API/Mock Data" and start_date >= end_date:
+            st.error("⚠️ End date must be after start date!")
+        elif short_ma >= long_ma:
+            st.error("⚠️ Short MA period must be less than Long MA period!")
         else:
-            with st.spinner('🔄 Fetching data and running backtest...'):
+            # Step labels update one status container, which collapses when
+            # the run finishes; warnings and errors go below it
+            status = st.status('🔄 Fetching data and running backtest...', expanded=True)
+            notices = st.container()
+            with status:
                 try:
-                    # Fetch data based on source
-                    progress_bar = st.progress(0)
-                    
                     if data_source == "Upload Excel":
                         # Load from uploaded file
-                        st.info("📂 Loading data from uploaded file...")
-                        progress_bar.progress(20)
+                        status.update(label="📂 Loading data from uploaded file...")
                         
                         from data.excel_loader import load_excel_data
                         raw_data = load_excel_data(uploaded_file.read())
                         
                         # Get symbols from uploaded data
                         selected_stocks = raw_data['Symbol'].unique().tolist()
-                        st.info(f"📊 Found {len(selected_stocks)} symbol(s): {', '.join(selected_stocks)}")
-                        
-                    else:
-                        # Fetch from API/Mock
-                        st.info("📥 Fetching equity data...")
-                        progress_bar.progress(20)
+                        status.write(f"📊 Found {len(selected_stocks)} symbol(s): {', '.join(selected_stocks)}")
                         
-                        raw_data = fetch_equity_data(
-                            selected_stocks,
-                            start_date.strftime('%Y-%m-%d'),
-                            end_date.strftime('%Y-%m-%d')
+                        results = run_equity_pipeline(
+                            raw_data,
+                            run_params,
+                            on_step=lambda label: status.update(label=label)
                         )
+                        data_attrs = raw_data.attrs
                     
-                    # Preprocess
-                    st.info("🧹 Preprocessing data...")
-                    progress_bar.progress(40)
-                    clean_data = preprocess_data(raw_data)
-                    
-                    # Add indicators
-                    st.info("📊 Calculating technical indicators...")
-                    progress_bar.progress(60)
-                    df_with_indicators = add_indicators(
-                        clean_data,
-                        short_ma=short_ma,
-                        long_ma=long_ma,
-                        rsi_period=rsi_period,
-                        macd_fast=macd_fast,
-                        macd_slow=macd_slow,
-                        macd_signal=macd_signal
-                    )
+                    else:
+                        # Fetch from API/Mock and run the whole pipeline as
+                        # one disk-cached call
+                        status.update(label="⚙️ Fetching equity data and running backtest...")
+                        
+                        symbols = tuple(sorted(selected_stocks))
+                        start_str = start_date.strftime('%Y-%m-%d')
+                        end_str = end_date.strftime('%Y-%m-%d')
+                        try:
+                            results, data_attrs = cached_equity_backtest(
+                                symbols,
+                                start_str,
+                                end_str,
+                                run_params,
+                                pd.Timestamp.today().strftime('%Y-%m-%d')
+                            )
+                        except MockDataFallback:
+                            # Mock data stays in the in-memory caches only
+                            raw_data = cached_fetch_equity_data(symbols, start_str, end_str)
+                            results = run_equity_pipeline(
+                                raw_data,
+                                run_params,
+                                on_step=lambda label: status.update(label=label)
+                            )
+                            data_attrs = raw_data.attrs
                     
-                    # Generate signals
-                    st.info("🎯 Generating trading signals...")
-                    progress_bar.progress(70)
-                    df_with_signals = generate_signals(
-                        df_with_indicators,
-                        rsi_oversold=rsi_oversold,
-                        rsi_overbought=rsi_overbought
-                    )
-                    
-                    # Run backtest
-                    st.info("⚙️ Running backtest simulation...")
-                    progress_bar.progress(85)
-                    results = run_backtest(
-                        df_with_signals,
-                        initial_capital=initial_capital,
-                        position_size=position_size,
-                        max_positions=max_positions,
-                        stop_loss_pct=stop_loss,
-                        take_profit_pct=take_profit
-                    )
+                    # New token per run; cached figure builders key on it
+                    # instead of hashing the result DataFrames
+                    results_token = uuid.uuid4().hex
                     
                     # Calculate metrics
-                    metrics_calc = PerformanceMetrics(results)
+                    metrics_calc = cached_performance_metrics(results_token, results)
                     metrics = metrics_calc.calculate_all_metrics()
                     
-                    progress_bar.progress(100)
+                    # Check if mock data was used
+                    if data_attrs.get('is_mock_data'):
+                        notices.warning("⚠️ **Using Mock Data**: The Hackathon API did not return data. Results are based on synthetic data for testing purposes only.")
                     
-                    #Check if mock data was used (will have predictable patterns)
-                    if len(raw_data) > 0:
-                        # Check if this looks like mock data (Symbol column values)
-                        if hasattr(raw_data, 'attrs') and raw_data.attrs.get('is_mock_data'):
-                            st.warning("⚠️ **Using Mock Data**: The Hackathon API did not return data. Results are based on synthetic data for testing purposes only.")
+                    failed_symbols = data_attrs.get('failed_symbols')
+                    if failed_symbols:
+                        notices.warning(f"⚠️ No data returned for: {', '.join(failed_symbols)}. Results exclude these symbols.")
                     
                     # Store in session state
                     st.session_state.backtest_results = results
                     st.session_state.metrics = metrics
                     st.session_state.market_type = "Equity"
+                    st.session_state.run_params = run_params
+                    st.session_state.results_token = results_token
+                    st.session_state.price_by_symbol = chart_frames_by_symbol(results['data'])
                     
-                    st.success("✅ Backtest completed successfully!")
+                    # Persist so a refresh or restart with the same parameters
+                    # can restore this run; synthetic results are not kept
+                    if run_key is not None and not data_attrs.get('is_mock_data'):
+                        save_results(results, run_key, "Equity", run_params)
                     
+                    status.update(label="✅ Backtest completed successfully!", state="complete", expanded=False)
+                
                 except Exception as e:
-                    st.error(f"❌ Error during backtest: {str(e)}")
+                    status.update(label="❌ Backtest failed", state="error")
+                    notices.error(f"❌ Error during backtest: {str(e)}")
                     import traceback
-                    st.code(traceback.format_exc())
+                    notices.code(traceback.format_exc())
     
     else:  # Futures mode
-        with st.spinner('🔄 Loading futures data and running backtest...'):
+        status = st.status('🔄 Loading futures data and running backtest...', expanded=True)
+        notices = st.container()
+        with status:
             try:
-                progress_bar = st.progress(0)
-                
                 # Handle data source
                 futures_data = None
                 if futures_data_source == "Upload Excel" and futures_uploaded_file is not None:
-                    st.info("📂 Loading futures data from uploaded file...")
-                    progress_bar.progress(20)
+                    status.update(label="📂 Loading futures data from uploaded file...")
                     
                     from data.excel_loader import load_excel_data
                     futures_data = load_excel_data(futures_uploaded_file.read())
                     
                     symbols = futures_data['Symbol'].unique().tolist()
-                    st.info(f"📊 Found {len(futures_data)} records for: {', '.join(symbols)}")
+                    status.write(f"📊 Found {len(futures_data)} records for: {', '.join(symbols)}")
                 else:
-                    st.info("📥 Loading pre-stored futures data...")
-                
-                progress_bar.progress(30)
+                    status.update(label="📥 Loading pre-stored futures data...")
+                    futures_data = cached_load_futures_data(
+                        str(DEFAULT_DATA_FILE),
+                        os.path.getmtime(DEFAULT_DATA_FILE)
+                    )
                 
                 # Run futures backtest
-                st.info("⚙️ Running futures backtest with smart money concepts...")
-                progress_bar.progress(50)
+                status.update(label="⚙️ Running futures backtest with smart money concepts...")
                 
+                # Imported here so equity-only sessions skip the futures
+                # engine (and its numba kernel) at startup
+                from backtesting.futures_engine import run_futures_backtest
                 results = run_futures_backtest(
                     initial_capital=initial_capital,
                     min_rr=min_rr,
@@ -480,188 +1110,197 @@ if run_backtest_button:
                 )
                 
                 # Calculate metrics for futures
-                st.info("📊 Calculating performance metrics...")
-                progress_bar.progress(85)
+                status.update(label="📊 Calculating performance metrics...")
                 
+                results_token = uuid.uuid4().hex
                 if not results['trade_history'].empty:
-                    metrics_calc = PerformanceMetrics(results)
+                    metrics_calc = cached_performance_metrics(results_token, results)
                     metrics = metrics_calc.calculate_all_metrics()
                 else:
                     # No trades executed
                     metrics = {}
                 
-                progress_bar.progress(100)
-                
                 # Store in session state
                 st.session_state.backtest_results = results
                 st.session_state.metrics = metrics
                 st.session_state.market_type = "Futures"
+                st.session_state.run_params = run_params
+                st.session_state.results_token = results_token
+                st.session_state.price_by_symbol = chart_frames_by_symbol(results['data'])
                 
-                st.success("✅ Futures backtest completed successfully!")
+                # Persist so a refresh or restart with the same parameters
+                # can restore this run
+                if run_key is not None:
+                    save_results(results, run_key, "Futures", run_params)
                 
+                status.update(label="✅ Futures backtest completed successfully!", state="complete", expanded=False)
+            
             except Exception as e:
-                st.error(f"❌ Error during futures backtest: {str(e)}")
+                status.update(label="❌ Backtest failed", state="error")
+                notices.error(f"❌ Error during futures backtest: {str(e)}")
                 import traceback
-                st.code(traceback.format_exc())
+                notices.code(traceback.format_exc())
 
 
-# Display results
-if st.session_state.backtest_results is not None:
-    results = st.session_state.backtest_results
-    metrics = st.session_state.metrics
+@st.fragment
+def render_price_view(results_token, price_by_symbol):
+    """
+    Render the price chart view.
     
-    # Key metrics at the top
-    st.markdown("## 📊 Performance Overview")
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        total_return = metrics['Total Return (%)']
-        st.metric(
-            "Total Return",
-            f"{total_return:.2f}%",
-            delta=f"{total_return:.2f}%"
-        )
+    Runs as its own fragment so changing the selected stock reruns only
+    this view.
     
-    with col2:
-        sharpe = metrics['Sharpe Ratio']
-        st.metric(
-            "Sharpe Ratio",
-            f"{sharpe:.2f}",
-            delta="Higher is better"
-        )
-    
-    with col3:
-        win_rate = metrics['Win Rate (%)']
-        st.metric(
-            "Win Rate",
-            f"{win_rate:.1f}%"
-        )
+    Args:
+        results_token: Identifier of the backtest run
+        price_by_symbol: Dict of symbol -> price/indicator DataFrame
+    """
+    st.markdown("### Price Charts with Trade Signals")
     
-    with col4:
-        max_dd = metrics['Max Drawdown (%)']
-        st.metric(
-            "Max Drawdown",
-            f"{abs(max_dd):.2f}%",
-            delta=f"-{abs(max_dd):.2f}%",
-            delta_color="inverse"
-        )
+    # Check market type and show appropriate selector
+    market_mode = st.session_state.get('market_type', 'Equity')
     
-    with col5:
-        total_trades = metrics['Total Trades']
-        st.metric(
-            "Total Trades",
-            f"{int(total_trades)}"
+    if market_mode == "Equity":
+        # Get selected stocks from results data
+        available_symbols = list(price_by_symbol)
+        # Remember the selection so switching views does not reset it
+        last_stock = st.session_state.get('price_symbol')
+        display_stock = st.selectbox(
+            "Select stock to view",
+            options=available_symbols,
+            index=available_symbols.index(last_stock) if last_stock in available_symbols else 0
         )
+        st.session_state.price_symbol = display_stock
+    else:
+        # Futures mode - only one symbol
+        display_stock = "NIFTY_FUT"
+        st.info("📊 Viewing NIFTY Futures")
     
-    st.markdown("---")
-    
-    # Tabs for different visualizations
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📈 Price Charts", "💰 Portfolio Performance", "📊 Trade Analysis", "⚠️ Risk Metrics", "📋 Trade Log"
-    ])
-    
-    with tab1:
-        st.markdown("### Price Charts with Trade Signals")
+    # Per-symbol frames are split once per run, so switching stocks is a
+    # dict lookup rather than a mask over the full results frame
+    if display_stock in price_by_symbol:
+        # Figures are built lazily once per stock in the run's figure store;
+        # reruns and switching back to a stock reuse them instead of
+        # re-assembling every trace
+        run_figs = run_figure_store(results_token)
+        price_key = ('price', display_stock)
         
-        # Check market type and show appropriate selector
-        market_mode = st.session_state.get('market_type', 'Equity')
+        if price_key not in run_figs:
+            stock_data = price_by_symbol[display_stock]
         
-        if market_mode == "Equity":
-            # Get selected stocks from results data
-            available_symbols = results['data']['Symbol'].unique().tolist()
-            display_stock = st.selectbox(
-                "Select stock to view",
-                options=available_symbols
-            )
-        else:
-            # Futures mode - only one symbol
-            display_stock = "NIFTY_FUT"
-            st.info("📊 Viewing NIFTY Futures")
+            # Futures data uses lower-case OHLC columns and a datetime column
+            x_col = 'datetime' if 'datetime' in stock_data.columns else 'Date'
+            if 'open' in stock_data.columns:
+                ohlc_cols = ['open', 'high', 'low', 'close']
+            else:
+                ohlc_cols = ['Open', 'High', 'Low', 'Close']
+            volume_col = 'volume' if 'volume' in stock_data.columns else 'Volume'
+            if volume_col not in stock_data.columns:
+                volume_col = None
         
-        if display_stock:
-            stock_data = results['data'][results['data']['Symbol'] == display_stock].copy()
+            # Aggregate long histories into at most MAX_CHART_CANDLES candles
+            candles = downsample_ohlc(stock_data, x_col, ohlc_cols, volume_col)
+            price_fig_caption = None
+            if len(candles) < len(stock_data):
+                price_fig_caption = (
+                    f"Showing {len(candles):,} aggregated candles "
+                    f"({len(stock_data):,} bars)"
+                )
+        
+            # Only add indicators for equity mode
+            show_indicators = market_mode == "Equity" and 'MA_Short' in stock_data.columns
             
-            # Create candlestick chart with indicators
+            # Two panels: price with RSI on a secondary axis, and MACD
+            # with volume on a secondary axis (volume alone for futures)
             fig = make_subplots(
-                rows=4, cols=1,
+                rows=2, cols=1,
                 shared_xaxes=True,
                 vertical_spacing=0.05,
-                row_heights=[0.5, 0.15, 0.15, 0.2],
+                row_heights=[0.65, 0.35],
+                specs=[[{"secondary_y": True}], [{"secondary_y": True}]],
                 subplot_titles=(
                     f'{display_stock} - Price & Indicators',
-                    'RSI',
-                    'MACD',
-                    'Volume'
+                    'MACD & Volume' if show_indicators else 'Volume'
                 )
             )
-            
-            # Candlestick
-            fig.add_trace(
+        
+            # Traces are collected with their panel placement and added
+            # to the figure in one batch
+            traces = [
                 go.Candlestick(
-                    x=stock_data['datetime'] if 'datetime' in stock_data.columns else stock_data.get('Date', stock_data.index),
-                    open=stock_data['open'] if 'open' in stock_data.columns else stock_data.get('Open'),
-                    high=stock_data['high'] if 'high' in stock_data.columns else stock_data.get('High'),
-                    low=stock_data['low'] if 'low' in stock_data.columns else stock_data.get('Low'),
-                    close=stock_data['close'] if 'close' in stock_data.columns else stock_data.get('Close'),
+                    x=candles[x_col],
+                    open=candles[ohlc_cols[0]],
+                    high=candles[ohlc_cols[1]],
+                    low=candles[ohlc_cols[2]],
+                    close=candles[ohlc_cols[3]],
                     name='Price'
-                ),
-                row=1, col=1
-            )
-            
-            # Only add indicators for equity mode
-            if market_mode == "Equity" and 'MA_Short' in stock_data.columns:
-                # Moving averages
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['MA_Short'],
-                        name=f'MA{short_ma}',
-                        line=dict(color='cyan', width=1)
-                    ),
-                    row=1, col=1
                 )
+            ]
+            rows = [1]
+            secondary_ys = [False]
+        
+            if show_indicators:
+                # MA labels come from the displayed run, not the sidebar
+                run_params = st.session_state.run_params
+                
+                # numpy arrays skip Plotly's Series-to-list coercion
+                dates = stock_data['Date'].to_numpy()
+                closes = stock_data['Close'].to_numpy()
                 
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['MA_Long'],
-                        name=f'MA{long_ma}',
+                # Signal positions from a single pass over the array, no
+                # filtered DataFrame copies
+                signals = stock_data['Signal'].to_numpy()
+                buy_idx = np.flatnonzero(signals == 1)
+                sell_idx = np.flatnonzero(signals == -1)
+                
+                # Indicator lines are thinned with MinMaxLTTB on the close:
+                # min/max preselection keeps the extremes, LTTB then picks
+                # the visually significant rows. Signal markers are sparse
+                # and stay complete.
+                line_idx = minmax_indices(closes, 4 * MAX_CHART_CANDLES)
+                line_idx = line_idx[lttb_indices(
+                    line_idx.astype(np.float64),
+                    closes[line_idx].astype(np.float64),
+                    MAX_CHART_CANDLES
+                )]
+                lines = stock_data.iloc[line_idx]
+                line_dates = lines['Date'].to_numpy()
+                macd_hist = lines['MACD_Hist'].to_numpy()
+                colors = np.where(macd_hist >= 0, '#00ff88', '#ff3366')
+                
+                traces += [
+                    # Moving averages
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['MA_Short'].to_numpy(),
+                        name=f"MA{run_params['short_ma']}",
+                        line=dict(color='cyan', width=1)
+                    ),
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['MA_Long'].to_numpy(),
+                        name=f"MA{run_params['long_ma']}",
                         line=dict(color='orange', width=1)
                     ),
-                    row=1, col=1
-                )
-                
-                # Bollinger Bands
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['BB_Upper'],
+                    # Bollinger Bands
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['BB_Upper'].to_numpy(),
                         name='BB Upper',
                         line=dict(color='gray', width=1, dash='dash'),
                         opacity=0.5
                     ),
-                    row=1, col=1
-                )
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['BB_Lower'],
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['BB_Lower'].to_numpy(),
                         name='BB Lower',
                         line=dict(color='gray', width=1, dash='dash'),
                         opacity=0.5,
                         fill='tonexty'
                     ),
-                    row=1, col=1
-                )
-                
-                # Buy signals
-                buy_signals = stock_data[stock_data['Signal'] == 1]
-                fig.add_trace(
-                    go.Scatter(
-                        x=buy_signals['Date'],
-                        y=buy_signals['Close'],
+                    # Buy signals
+                    go.Scattergl(
+                        x=dates[buy_idx],
+                        y=closes[buy_idx],
                         mode='markers',
                         name='Buy Signal',
                         marker=dict(
@@ -671,15 +1310,10 @@ if st.session_state.backtest_results is not None:
                             line=dict(color='white', width=1)
                         )
                     ),
-                    row=1, col=1
-                )
-                
-                # Sell signals
-                sell_signals = stock_data[stock_data['Signal'] == -1]
-                fig.add_trace(
-                    go.Scatter(
-                        x=sell_signals['Date'],
-                        y=sell_signals['Close'],
+                    # Sell signals
+                    go.Scattergl(
+                        x=dates[sell_idx],
+                        y=closes[sell_idx],
                         mode='markers',
                         name='Sell Signal',
                         marker=dict(
@@ -689,364 +1323,307 @@ if st.session_state.backtest_results is not None:
                             line=dict(color='white', width=1)
                         )
                     ),
-                    row=1, col=1
-                )
-                
-                # RSI
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['RSI'],
+                    # RSI
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['RSI'].to_numpy(),
                         name='RSI',
                         line=dict(color='purple', width=2)
                     ),
-                    row=2, col=1
-                )
-                
-                # RSI levels
-                fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-                
-                # MACD
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['MACD'],
+                    # MACD
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['MACD'].to_numpy(),
                         name='MACD',
                         line=dict(color='blue', width=2)
                     ),
-                    row=3, col=1
-                )
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=stock_data['Date'],
-                        y=stock_data['MACD_Signal'],
+                    go.Scattergl(
+                        x=line_dates,
+                        y=lines['MACD_Signal'].to_numpy(),
                         name='Signal',
                         line=dict(color='red', width=2)
                     ),
-                    row=3, col=1
-                )
-                
-                # MACD Histogram
-                colors = ['green' if val >= 0 else 'red' for val in stock_data['MACD_Hist']]
-                fig.add_trace(
+                    # MACD Histogram
                     go.Bar(
-                        x=stock_data['Date'],
-                        y=stock_data['MACD_Hist'],
+                        x=line_dates,
+                        y=macd_hist,
                         name='Histogram',
                         marker_color=colors,
                         opacity=0.5
-                    ),
-                    row=3, col=1
-                )
-            
+                    )
+                ]
+                # Price panel: MAs, bands, signals, then RSI on the
+                # secondary axis; MACD panel: MACD, signal, histogram
+                rows += [1] * 7 + [2] * 3
+                secondary_ys += [False] * 6 + [True] + [False] * 3
+        
             # Volume (available for both modes)
-            volume_col = 'volume' if 'volume' in stock_data.columns else 'Volume'
-            if volume_col in stock_data.columns:
-                x_col = 'datetime' if 'datetime' in stock_data.columns else 'Date'
-                fig.add_trace(
+            if volume_col is not None:
+                traces.append(
                     go.Bar(
-                        x=stock_data[x_col],
-                        y=stock_data[volume_col] if volume_col in stock_data.columns else None,
+                        x=candles[x_col],
+                        y=candles[volume_col],
                         name='Volume',
                         marker_color='rgba(0, 212, 255, 0.5)'
-                    ),
-                    row=4, col=1
+                    )
+                )
+                rows.append(2)
+                secondary_ys.append(show_indicators)
+            
+            fig.add_traces(traces, rows=rows, cols=1, secondary_ys=secondary_ys)
+            
+            if show_indicators:
+                # RSI levels
+                fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5,
+                              row=1, col=1, secondary_y=True)
+                fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5,
+                              row=1, col=1, secondary_y=True)
+        
+            # Axis titles for the two panels (yaxis2/yaxis4 are the
+            # secondary axes), applied with the rest of the layout in one
+            # update_layout call
+            if show_indicators:
+                panel_axes = dict(
+                    yaxis2=dict(title_text="RSI", range=[0, 100], showgrid=False),
+                    yaxis3=dict(title_text="MACD"),
+                    yaxis4=dict(title_text="Volume", showgrid=False)
                 )
+            else:
+                panel_axes = dict(yaxis3=dict(title_text="Volume"))
             
-            # Update layout
             fig.update_layout(
-                height=1000,
-                template='plotly_dark',
+                height=900,
                 showlegend=True,
                 xaxis_rangeslider_visible=False,
-                hovermode='x unified'
+                hovermode='x unified',
+                # Keep zoom/pan state until a new backtest is run
+                uirevision=results_token,
+                xaxis2_title_text="Date",
+                yaxis_title_text="Price (₹)",
+                **panel_axes
             )
             
-            fig.update_xaxes(title_text="Date", row=4, col=1)
-            fig.update_yaxes(title_text="Price (₹)", row=1, col=1)
-            if market_mode == "Equity":
-                fig.update_yaxes(title_text="RSI", row=2, col=1, range=[0, 100])
-                fig.update_yaxes(title_text="MACD", row=3, col=1)
-            fig.update_yaxes(title_text="Volume", row=4, col=1)
-            
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        st.markdown("### Portfolio Value Over Time")
+            run_figs[price_key] = (fig, price_fig_caption)
         
-        portfolio_df = results['portfolio_history']
-        
-        # Create portfolio value chart
-        fig = go.Figure()
-        
-        # Portfolio value
-        fig.add_trace(
-            go.Scatter(
-                x=portfolio_df['Date'],
-                y=portfolio_df['Portfolio_Value'],
-                name='Portfolio Value',
-                line=dict(color='#00ff88', width=3),
-                fill='tozeroy',
-                fillcolor='rgba(0, 255, 136, 0.1)'
+        fig, price_fig_caption = run_figs[price_key]
+        if price_fig_caption:
+            st.caption(price_fig_caption)
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def render_trade_log(results_token, trade_df):
+    """
+    Render the paginated trade log and its CSV download.
+    
+    Runs as its own fragment so paging reruns only this view.
+    
+    Args:
+        results_token: Identifier of the backtest run
+        trade_df: Trade history DataFrame
+    """
+    st.markdown("### Complete Trade Log")
+    
+    if not trade_df.empty:
+        # Paginate so only the visible slice is formatted and sent
+        page_count = (len(trade_df) - 1) // TRADE_LOG_PAGE_SIZE + 1
+        page = 1
+        if page_count > 1:
+            page = st.number_input(
+                f"Page (1-{page_count})",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                step=1
             )
-        )
+        start = (page - 1) * TRADE_LOG_PAGE_SIZE
+        stop = min(start + TRADE_LOG_PAGE_SIZE, len(trade_df))
+        st.caption(f"Showing trades {start + 1}-{stop} of {len(trade_df)}")
         
-        # Benchmark (buy and hold initial value)
-        fig.add_hline(
-            y=initial_capital,
-            line_dash="dash",
-            line_color="orange",
-            annotation_text="Initial Capital",
-            annotation_position="right"
+        # Columns stay numeric/datetime64; the browser formats them
+        page_df = trade_df.iloc[start:stop]
+        st.dataframe(
+            page_df[[
+                'Symbol', 'Entry_Date', 'Exit_Date', 
+                'Entry_Price', 'Exit_Price', 'Quantity',
+                'PnL', 'PnL_Pct', 'Duration_Days', 'Exit_Reason'
+            ]].assign(PnL_Pct=page_df['PnL_Pct'] * 100),
+            column_config=TRADE_LOG_COLUMN_CONFIG,
+            use_container_width=True,
+            height=600
         )
         
-        fig.update_layout(
-            title="Portfolio Growth",
-            xaxis_title="Date",
-            yaxis_title="Value (₹)",
-            template='plotly_dark',
-            height=500,
-            hovermode='x unified'
+        # Download button (encoded once per backtest run)
+        st.download_button(
+            label="📥 Download Trade Log (CSV)",
+            data=trade_log_csv(results_token, trade_df),
+            file_name="trade_log.csv",
+            mime="text/csv"
         )
+    else:
+        st.warning("No trades were executed in this backtest.")
+
+
+@st.fragment
+def render_results():
+    """
+    Render the results panel for the stored backtest.
+    
+    Runs as a fragment, so widgets inside it (view selector, stock picker,
+    trade log page) rerun only this panel instead of the whole script.
+    """
+    results = st.session_state.backtest_results
+    metrics = st.session_state.metrics
+    results_token = st.session_state.results_token
+    
+    # Bind result frames once for all views
+    price_by_symbol = st.session_state.price_by_symbol
+    portfolio_df = results['portfolio_history']
+    trade_df = results['trade_history']
+    
+    # Key metrics at the top
+    st.markdown("## 📊 Performance Overview")
+    
+    total_return = metrics['Total Return (%)']
+    max_dd = abs(metrics['Max Drawdown (%)'])
+    overview_cards = [
+        ("Total Return", f"{total_return:.2f}%", dict(delta=f"{total_return:.2f}%")),
+        ("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}", dict(delta="Higher is better")),
+        ("Win Rate", f"{metrics['Win Rate (%)']:.1f}%", {}),
+        ("Max Drawdown", f"{max_dd:.2f}%", dict(delta=f"-{max_dd:.2f}%", delta_color="inverse")),
+        ("Total Trades", f"{int(metrics['Total Trades'])}", {}),
+    ]
+    
+    for col, (label, value, extra) in zip(st.columns(len(overview_cards)), overview_cards):
+        col.metric(label, value, **extra)
+    
+    st.markdown("---")
+    
+    # View selector for different visualizations. Unlike st.tabs, only the
+    # selected view is built on each rerun.
+    active_view = st.radio(
+        "View",
+        options=RESULT_VIEWS,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="results_view"
+    )
+    
+    if active_view == "📈 Price Charts":
+        render_price_view(results_token, price_by_symbol)
+    
+    if active_view == "💰 Portfolio Performance":
+        st.markdown("### Portfolio Value Over Time")
         
-        st.plotly_chart(fig, use_container_width=True)
+        # The three charts share the portfolio history's date axis
+        dates = portfolio_df['Date'].to_numpy()
+        
+        st.plotly_chart(
+            run_figure(
+                results_token, 'portfolio',
+                lambda: portfolio_figure(results['initial_capital'], dates, portfolio_df)
+            ),
+            use_container_width=True
+        )
         
         # Drawdown chart
         st.markdown("### Drawdown Analysis")
         
-        metrics_calc = PerformanceMetrics(results)
-        drawdown_df = metrics_calc.get_drawdown_series()
-        
-        fig_dd = go.Figure()
-        
-        fig_dd.add_trace(
-            go.Scatter(
-                x=drawdown_df['Date'],
-                y=drawdown_df['Drawdown'] * 100,
-                name='Drawdown',
-                line=dict(color='#ff3366', width=2),
-                fill='tozeroy',
-                fillcolor='rgba(255, 51, 102, 0.2)'
-            )
-        )
-        
-        fig_dd.update_layout(
-            title="Underwater Plot (Drawdown %)",
-            xaxis_title="Date",
-            yaxis_title="Drawdown (%)",
-            template='plotly_dark',
-            height=400,
-            hovermode='x unified'
+        st.plotly_chart(
+            run_figure(
+                results_token, 'drawdown',
+                lambda: drawdown_figure(dates, cached_drawdown_series(results_token, results))
+            ),
+            use_container_width=True
         )
         
-        st.plotly_chart(fig_dd, use_container_width=True)
-        
         # Cash vs Invested
         st.markdown("### Cash vs Invested Capital")
         
-        fig_alloc = go.Figure()
-        
-        fig_alloc.add_trace(
-            go.Scatter(
-                x=portfolio_df['Date'],
-                y=portfolio_df['Cash'],
-                name='Cash',
-                line=dict(color='cyan', width=2),
-                stackgroup='one'
-            )
-        )
-        
-        fig_alloc.add_trace(
-            go.Scatter(
-                x=portfolio_df['Date'],
-                y=portfolio_df['Positions_Value'],
-                name='Invested',
-                line=dict(color='#00ff88', width=2),
-                stackgroup='one'
-            )
-        )
-        
-        fig_alloc.update_layout(
-            title="Portfolio Allocation",
-            xaxis_title="Date",
-            yaxis_title="Value (₹)",
-            template='plotly_dark',
-            height=400,
-            hovermode='x unified'
+        st.plotly_chart(
+            run_figure(results_token, 'allocation', lambda: allocation_figure(dates, portfolio_df)),
+            use_container_width=True
         )
-        
-        st.plotly_chart(fig_alloc, use_container_width=True)
     
-    with tab3:
-        st.markdown("### Trade Analysis")
-        
-        trade_df = results['trade_history']
-        
-        if not trade_df.empty:
+    if active_view == "📊 Trade Analysis":
+        # Check emptiness first so an empty run renders a single widget
+        if trade_df.empty:
+            st.warning("No trades were executed in this backtest.")
+        else:
+            st.markdown("### Trade Analysis")
+            
             col1, col2 = st.columns(2)
             
             with col1:
                 # P&L distribution
-                fig_pnl = go.Figure()
-                
-                winning_trades = trade_df[trade_df['PnL'] > 0]
-                losing_trades = trade_df[trade_df['PnL'] < 0]
-                
-                fig_pnl.add_trace(
-                    go.Bar(
-                        x=winning_trades.index,
-                        y=winning_trades['PnL'],
-                        name='Wins',
-                        marker_color='#00ff88'
-                    )
-                )
-                
-                fig_pnl.add_trace(
-                    go.Bar(
-                        x=losing_trades.index,
-                        y=losing_trades['PnL'],
-                        name='Losses',
-                        marker_color='#ff3366'
-                    )
+                st.plotly_chart(
+                    run_figure(results_token, 'pnl', lambda: pnl_figure(trade_df)),
+                    use_container_width=True
                 )
-                
-                fig_pnl.update_layout(
-                    title="Trade P&L Distribution",
-                    xaxis_title="Trade Number",
-                    yaxis_title="P&L (₹)",
-                    template='plotly_dark',
-                    height=400
-                )
-                
-                st.plotly_chart(fig_pnl, use_container_width=True)
             
             with col2:
                 # Trade duration
-                fig_duration = go.Figure()
-                
-                fig_duration.add_trace(
-                    go.Histogram(
-                        x=trade_df['Duration_Days'],
-                        nbinsx=20,
-                        name='Duration',
-                        marker_color='#00d4ff'
-                    )
-                )
-                
-                fig_duration.update_layout(
-                    title="Trade Duration Distribution",
-                    xaxis_title="Days Held",
-                    yaxis_title="Number of Trades",
-                    template='plotly_dark',
-                    height=400
+                st.plotly_chart(
+                    run_figure(results_token, 'duration', lambda: duration_figure(trade_df)),
+                    use_container_width=True
                 )
-                
-                st.plotly_chart(fig_duration, use_container_width=True)
             
-            # Exit reason pie chart
+            # Exit reason breakdown
             st.markdown("### Exit Reasons")
             
-            exit_reasons = trade_df['Exit_Reason'].value_counts()
-            
-            fig_exit = go.Figure(
-                data=[
-                    go.Pie(
-                        labels=exit_reasons.index,
-                        values=exit_reasons.values,
-                        hole=0.4,
-                        marker_colors=['#00ff88', '#ff3366', '#00d4ff', '#ffa500']
-                    )
-                ]
-            )
-            
-            fig_exit.update_layout(
-                title="Trade Exit Reasons",
-                template='plotly_dark',
+            # A handful of bars needs no Plotly figure; the native chart
+            # sends just the counts
+            exit_labels, exit_counts = exit_reason_breakdown(results_token, trade_df)
+            st.bar_chart(
+                pd.DataFrame({'Exit Reason': exit_labels, 'Trades': exit_counts}),
+                x='Exit Reason',
+                y='Trades',
+                color='#00d4ff',
                 height=400
             )
-            
-            st.plotly_chart(fig_exit, use_container_width=True)
-            
-        else:
-            st.warning("No trades were executed in this backtest.")
     
-    with tab4:
+    if active_view == "⚠️ Risk Metrics":
         st.markdown("### Risk Metrics")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Return Metrics")
-            st.metric("Total Return", f"{metrics['Total Return (%)']:.2f}%")
-            st.metric("Annualized Return", f"{metrics['Annualized Return (%)']:.2f}%")
-            st.metric("Average Trade Return", f"{metrics['Average Trade (%)']:.2f}%")
-            st.metric("Best Trade", f"{metrics['Best Trade (%)']:.2f}%")
-            st.metric("Worst Trade", f"{metrics['Worst Trade (%)']:.2f}%")
-        
-        with col2:
-            st.markdown("#### Risk Metrics")
-            st.metric("Volatility (Annualized)", f"{metrics['Volatility (%)']:.2f}%")
-            st.metric("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}")
-            st.metric("Max Drawdown", f"{abs(metrics['Max Drawdown (%)']):.2f}%")
-            st.metric("Calmar Ratio", f"{metrics['Calmar Ratio']:.2f}")
-            st.metric("Profit Factor", f"{metrics['Profit Factor']:.2f}")
-        
-        st.markdown("---")
-        
-        col3, col4 = st.columns(2)
-        
-        with col3:
-            st.markdown("#### Trade Statistics")
-            st.metric("Total Trades", f"{int(metrics['Total Trades'])}")
-            st.metric("Winning Trades", f"{int(metrics['Winning Trades'])}")
-            st.metric("Losing Trades", f"{int(metrics['Losing Trades'])}")
-            st.metric("Win Rate", f"{metrics['Win Rate (%)']:.1f}%")
-        
-        with col4:
-            st.markdown("#### Advanced Metrics")
-            st.metric("Avg Winning Trade", f"{metrics['Average Winning Trade (%)']:.2f}%")
-            st.metric("Avg Losing Trade", f"{metrics['Average Losing Trade (%)']:.2f}%")
-            st.metric("Avg Hold Time", f"{metrics['Average Hold Time (days)']:.1f} days")
-            st.metric("Max DD Duration", f"{int(metrics['Max Drawdown Duration (days)'])} days")
-    
-    with tab5:
-        st.markdown("### Complete Trade Log")
-        
-        trade_df = results['trade_history']
+        metric_sections = [
+            ("Return Metrics", [
+                ("Total Return", f"{metrics['Total Return (%)']:.2f}%"),
+                ("Annualized Return", f"{metrics['Annualized Return (%)']:.2f}%"),
+                ("Average Trade Return", f"{metrics['Average Trade (%)']:.2f}%"),
+                ("Best Trade", f"{metrics['Best Trade (%)']:.2f}%"),
+                ("Worst Trade", f"{metrics['Worst Trade (%)']:.2f}%"),
+            ]),
+            ("Risk Metrics", [
+                ("Volatility (Annualized)", f"{metrics['Volatility (%)']:.2f}%"),
+                ("Sharpe Ratio", f"{metrics['Sharpe Ratio']:.2f}"),
+                ("Max Drawdown", f"{abs(metrics['Max Drawdown (%)']):.2f}%"),
+                ("Calmar Ratio", f"{metrics['Calmar Ratio']:.2f}"),
+                ("Profit Factor", f"{metrics['Profit Factor']:.2f}"),
+            ]),
+            ("Trade Statistics", [
+                ("Total Trades", f"{int(metrics['Total Trades'])}"),
+                ("Winning Trades", f"{int(metrics['Winning Trades'])}"),
+                ("Losing Trades", f"{int(metrics['Losing Trades'])}"),
+                ("Win Rate", f"{metrics['Win Rate (%)']:.1f}%"),
+            ]),
+            ("Advanced Metrics", [
+                ("Avg Winning Trade", f"{metrics['Average Winning Trade (%)']:.2f}%"),
+                ("Avg Losing Trade", f"{metrics['Average Losing Trade (%)']:.2f}%"),
+                ("Avg Hold Time", f"{metrics['Average Hold Time (days)']:.1f} days"),
+                ("Max DD Duration", f"{int(metrics['Max Drawdown Duration (days)'])} days"),
+            ]),
+        ]
         
-        if not trade_df.empty:
-            # Format dataframe for display
-            display_df = trade_df.copy()
-            display_df['Entry_Date'] = pd.to_datetime(display_df['Entry_Date']).dt.strftime('%Y-%m-%d')
-            display_df['Exit_Date'] = pd.to_datetime(display_df['Exit_Date']).dt.strftime('%Y-%m-%d')
-            display_df['Entry_Price'] = display_df['Entry_Price'].apply(lambda x: f"₹{x:.2f}")
-            display_df['Exit_Price'] = display_df['Exit_Price'].apply(lambda x: f"₹{x:.2f}")
-            display_df['PnL'] = display_df['PnL'].apply(lambda x: f"₹{x:.2f}")
-            display_df['PnL_Pct'] = display_df['PnL_Pct'].apply(lambda x: f"{x*100:.2f}%")
-            
-            st.dataframe(
-                display_df[[
-                    'Symbol', 'Entry_Date', 'Exit_Date', 
-                    'Entry_Price', 'Exit_Price', 'Quantity',
-                    'PnL', 'PnL_Pct', 'Duration_Days', 'Exit_Reason'
-                ]],
-                use_container_width=True,
-                height=600
-            )
-            
-            # Download button
-            csv = trade_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Trade Log (CSV)",
-                data=csv,
-                file_name="trade_log.csv",
-                mime="text/csv"
-            )
-        else:
-            st.warning("No trades were executed in this backtest.")
+        # Single markdown block instead of 18 separate st.metric widgets
+        st.markdown(render_metric_grid(metric_sections), unsafe_allow_html=True)
+    
+    if active_view == "📋 Trade Log":
+        render_trade_log(results_token, trade_df)
+
 
+# Display results
+if st.session_state.backtest_results is not None:
+    render_results()
 else:
     # Welcome message when no backtest has been run
     st.markdown("""
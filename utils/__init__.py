@@ -0,0 +1 @@
+# Utility module for helpers shared across packages
@@ -0,0 +1,54 @@
+"""
+Downsampling helpers for charting long series.
+"""
+import numpy as np
+
+from utils.jit import njit
+
+
+@njit(cache=True)
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets point selection.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+
+    Args:
+        x: Float64 array of x positions (increasing)
+        y: Float64 array of values, without NaNs
+        n_out: Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted int64 positions into x/y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        max_area = -1.0
+        chosen = start
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                chosen = j
+        out[i + 1] = chosen
+        a = chosen
+    return out
@@ -0,0 +1,21 @@
+"""
+Optional Numba JIT support.
+Exposes numba's njit when installed, otherwise a no-op decorator so
+decorated functions still run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -0,0 +1,103 @@
+"""
+On-disk store for recent backtest runs.
+Result DataFrames are written as Feather files keyed on the run parameters,
+so a browser refresh or server restart can restore a run with the same
+parameters without refetching and rerunning.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+
+# Default location for persisted results, alongside the packages
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "cache"
+
+# Results entries stored as Feather files; the rest are scalars
+FRAME_KEYS = ("data", "portfolio_history", "trade_history")
+SCALAR_KEYS = ("initial_capital", "final_capital")
+
+# Runs kept on disk; older ones are removed when a new run is saved
+MAX_STORED_RUNS = 8
+
+
+def results_key(params):
+    """
+    Short stable key for a set of run parameters.
+
+    Args:
+        params: Dictionary of everything that determines the run
+
+    Returns:
+        str: 16-character hex digest
+    """
+    return hashlib.sha1(repr(sorted(params.items())).encode()).hexdigest()[:16]
+
+
+def save_results(results, key, market_type, params, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Persist a backtest results dictionary under its key.
+
+    The run's parameters and market type are written to <key>.json next to
+    the frames. Only the MAX_STORED_RUNS most recent runs are kept.
+
+    Args:
+        results: Backtest results dictionary
+        key: Key from results_key for the run parameters
+        market_type: "Equity" or "Futures"
+        params: Dictionary of the strategy parameters used for the run
+        cache_dir: Directory to write to
+
+    Returns:
+        bool: True if the run was written
+    """
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for name in FRAME_KEYS:
+            feather.write_feather(results[name], cache_dir / f"{key}_{name}.feather")
+
+        meta = {
+            "market_type": market_type,
+            "params": params,
+            **{name: float(results[name]) for name in SCALAR_KEYS}
+        }
+        (cache_dir / f"{key}.json").write_text(json.dumps(meta))
+    except (OSError, TypeError, ValueError, pa.ArrowException) as e:
+        print(f"Could not persist backtest results: {e}")
+        return False
+
+    # Metadata is written last, so its mtime orders complete runs
+    runs = sorted(cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for meta_path in runs[MAX_STORED_RUNS:]:
+        meta_path.unlink(missing_ok=True)
+        for name in FRAME_KEYS:
+            (cache_dir / f"{meta_path.stem}_{name}.feather").unlink(missing_ok=True)
+    return True
+
+
+def load_results(key, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load a persisted backtest run by key.
+
+    Args:
+        key: Key from results_key for the run parameters
+        cache_dir: Directory written by save_results
+
+    Returns:
+        tuple: (results dictionary, market_type, params), or
+        (None, None, None) if no complete run is stored under the key
+    """
+    cache_dir = Path(cache_dir)
+    try:
+        meta = json.loads((cache_dir / f"{key}.json").read_text())
+        results = {
+            name: feather.read_feather(cache_dir / f"{key}_{name}.feather")
+            for name in FRAME_KEYS
+        }
+        results.update({name: meta[name] for name in SCALAR_KEYS})
+        return results, meta["market_type"], meta["params"]
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None, None, None